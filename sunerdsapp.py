@@ -1,92 +1,301 @@
 import sqlite3
 from datetime import datetime
+import functools
+import hashlib
+import itertools
 import math
+import os
+import threading
+import uuid
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from PIL import Image
 import io
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, wait
 import json
+from cachetools import TTLCache
+from geopy.extra.rate_limiter import RateLimiter
 from geopy.geocoders import Nominatim
 from timezonefinder import TimezoneFinder
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels then run as plain NumPy
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@dataclass(slots=True)
+class FinancialData:
+    """Latest financial parameters recorded for a property"""
+    electricity_rate: float
+    installation_cost_per_watt: float
+    incentives: float
+    financing_rate: float
+    financing_term: int
+    maintenance_cost_annual: float
+    electricity_price_increase: float
+
+ANNUAL_DEGRADATION = 0.005  # 0.5% panel output loss per year
+
+@functools.lru_cache(maxsize=32)
+def _degradation_factors(years: int) -> np.ndarray:
+    """Fraction of initial production remaining in years 1..years"""
+    factors = 1 - ANNUAL_DEGRADATION * np.arange(1, years + 1)
+    factors.setflags(write=False)
+    return factors
+
+@functools.lru_cache(maxsize=32)
+def _rate_powers(increase: float, years: int) -> np.ndarray:
+    """Electricity rate multipliers (1 + increase)^k for k in 0..years"""
+    powers = (1 + increase) ** np.arange(years + 1)
+    powers.setflags(write=False)
+    return powers
+
+MAX_IRRADIANCE = 1000.0  # W/m² on a clear day
+
+@njit(cache=True, fastmath=True)
+def _irradiance_kernel(cloud_cover):
+    """Irradiance for a cloud cover percentage (scalar or array)"""
+    return MAX_IRRADIANCE * (1.0 - (cloud_cover / 100.0) * 0.75)
+
+PANEL_EFFICIENCY = 0.20
+DEFAULT_CLOUD_COVER = 30.0  # % used when a property has no measurements
+
+# Roof azimuth in degrees from due south, east negative, for the 16-point
+# compass rose
+ORIENTATION_AZIMUTHS = {
+    "S": 0.0, "SSW": 22.5, "SW": 45.0, "WSW": 67.5,
+    "W": 90.0, "WNW": 112.5, "NW": 135.0, "NNW": 157.5,
+    "N": 180.0, "NNE": -157.5, "NE": -135.0, "ENE": -112.5,
+    "E": -90.0, "ESE": -67.5, "SE": -45.0, "SSE": -22.5
+}
+
+def _orientation_azimuth(orientation: str) -> float:
+    """Azimuth for a compass orientation such as "S", "SSE" or "South-West" """
+    if orientation is None:
+        raise ValueError("Roof orientation is required")
+    
+    code = orientation.upper()
+    for separator in (" ", "-", "_"):
+        code = code.replace(separator, "")
+    for name in ("NORTH", "SOUTH", "EAST", "WEST"):
+        code = code.replace(name, name[0])
+    
+    if code not in ORIENTATION_AZIMUTHS:
+        raise ValueError(f"Unknown roof orientation: {orientation}")
+    return ORIENTATION_AZIMUTHS[code]
+
+@functools.lru_cache(maxsize=64)
+def _incidence_cosines(latitude: float, tilt: float, azimuth: float) -> np.ndarray:
+    """Hourly cosine of the sun's angle of incidence on a tilted surface
+    
+    Covers the 8760 hours of a year in solar time and is zero whenever the
+    sun is below the horizon or behind the surface.
+    """
+    hours = np.arange(8760)
+    day = hours // 24 + 1
+    
+    phi = np.radians(latitude)
+    beta = np.radians(tilt)
+    gamma = np.radians(azimuth)
+    delta = np.radians(23.45 * np.sin(np.radians(360.0 * (284 + day) / 365)))
+    omega = np.radians(15.0 * (hours % 24 + 0.5 - 12))
+    
+    sin_d, cos_d = np.sin(delta), np.cos(delta)
+    cos_w = np.cos(omega)
+    cos_zenith = np.sin(phi) * sin_d + np.cos(phi) * cos_d * cos_w
+    cos_incidence = (
+        sin_d * np.sin(phi) * np.cos(beta)
+        - sin_d * np.cos(phi) * np.sin(beta) * np.cos(gamma)
+        + cos_d * np.cos(phi) * np.cos(beta) * cos_w
+        + cos_d * np.sin(phi) * np.sin(beta) * np.cos(gamma) * cos_w
+        + cos_d * np.sin(beta) * np.sin(gamma) * np.sin(omega)
+    )
+    
+    cosines = np.where(cos_zenith > 0, np.clip(cos_incidence, 0.0, None), 0.0)
+    cosines.setflags(write=False)
+    return cosines
+
 class SolarAudit:
-    def __init__(self, db_path: str = "solar_audit.db", weather_api_key: str = None):
+    # Insert statements shared by the single-row and batch paths
+    _INSERT_PROPERTY_SQL = '''
+        INSERT INTO properties 
+        (address, latitude, longitude, timezone, roof_area, roof_angle, 
+         orientation, shading_factor, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    _INSERT_PHOTO_SQL = '''
+        INSERT INTO photos 
+        (property_id, photo_type, photo_sha256, photo_path, gps_latitude,
+         gps_longitude, timestamp, notes)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    _INSERT_FINANCIAL_SQL = '''
+        INSERT INTO financial_data 
+        (property_id, electricity_rate, installation_cost_per_watt, incentives,
+         financing_rate, financing_term, maintenance_cost_annual,
+         electricity_price_increase, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    # Property columns used when building reports
+    _REPORT_PROPERTY_COLUMNS = '''
+        id, address, latitude, longitude, timezone, roof_area, roof_angle,
+        orientation, shading_factor
+    '''
+    # Photos resized concurrently per chunk in add_photos
+    _PHOTO_BATCH_SIZE = 16
+
+    def __init__(self, db_path: str = "solar_audit.db", weather_api_key: str = None,
+                 photo_dir: str = None):
         self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
         self.weather_api_key = weather_api_key
+        # Stored photo paths are absolute so the database stays valid from
+        # any working directory; photos default to a folder beside the DB
+        if photo_dir is None:
+            photo_dir = os.path.join(os.path.dirname(os.path.abspath(db_path)), "photos")
+        self.photo_dir = os.path.abspath(photo_dir)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Current conditions change at most every ~10 minutes upstream
+        self._weather_cache = TTLCache(maxsize=128, ttl=600)
+        self._weather_lock = threading.Lock()
+        self._geolocator = Nominatim(user_agent="solar_audit_app")
+        # Nominatim allows one request per second; pace calls rather than
+        # running into throttling
+        self._geocode = RateLimiter(self._geolocator.geocode, min_delay_seconds=1,
+                                    max_retries=2, error_wait_seconds=2.0,
+                                    swallow_exceptions=False)
+        # Load the timezone polygons into RAM once instead of reading the
+        # binary files on every lookup
+        self._tf = TimezoneFinder(in_memory=True)
+        self._lookup_location = functools.lru_cache(maxsize=256)(self._geocode_address)
         self.setup_database()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the database connection and HTTP session"""
+        self._session.close()
+        self.conn.close()
         
     def setup_database(self):
         """Initialize enhanced database tables"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS properties (
-                id INTEGER PRIMARY KEY,
-                address TEXT,
-                latitude FLOAT,
-                longitude FLOAT,
-                timezone TEXT,
-                roof_area FLOAT,
-                roof_angle FLOAT,
-                orientation TEXT,
-                shading_factor FLOAT,
-                created_at TIMESTAMP
-            )
-        ''')
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
         
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS measurements (
-                id INTEGER PRIMARY KEY,
-                property_id INTEGER,
-                solar_irradiance FLOAT,
-                temperature FLOAT,
-                humidity FLOAT,
-                cloud_cover FLOAT,
-                timestamp TIMESTAMP,
-                FOREIGN KEY (property_id) REFERENCES properties (id)
-            )
-        ''')
+        with self.conn:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS properties (
+                    id INTEGER PRIMARY KEY,
+                    address TEXT,
+                    latitude FLOAT,
+                    longitude FLOAT,
+                    timezone TEXT,
+                    roof_area FLOAT,
+                    roof_angle FLOAT,
+                    orientation TEXT,
+                    shading_factor FLOAT,
+                    created_at TIMESTAMP
+                )
+            ''')
         
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS photos (
-                id INTEGER PRIMARY KEY,
-                property_id INTEGER,
-                photo_type TEXT,
-                photo_data BLOB,
-                gps_latitude FLOAT,
-                gps_longitude FLOAT,
-                timestamp TIMESTAMP,
-                notes TEXT,
-                FOREIGN KEY (property_id) REFERENCES properties (id)
-            )
-        ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS measurements (
+                    id INTEGER PRIMARY KEY,
+                    property_id INTEGER,
+                    solar_irradiance FLOAT,
+                    temperature FLOAT,
+                    humidity FLOAT,
+                    cloud_cover FLOAT,
+                    timestamp TIMESTAMP,
+                    FOREIGN KEY (property_id) REFERENCES properties (id)
+                )
+            ''')
         
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS financial_data (
-                id INTEGER PRIMARY KEY,
-                property_id INTEGER,
-                electricity_rate FLOAT,
-                installation_cost_per_watt FLOAT,
-                incentives FLOAT,
-                financing_rate FLOAT,
-                financing_term INTEGER,
-                maintenance_cost_annual FLOAT,
-                electricity_price_increase FLOAT,
-                timestamp TIMESTAMP,
-                FOREIGN KEY (property_id) REFERENCES properties (id)
-            )
-        ''')
-        
-        self.conn.commit()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS photos (
+                    id INTEGER PRIMARY KEY,
+                    property_id INTEGER,
+                    photo_type TEXT,
+                    photo_data BLOB,
+                    photo_sha256 TEXT,
+                    photo_path TEXT,
+                    gps_latitude FLOAT,
+                    gps_longitude FLOAT,
+                    timestamp TIMESTAMP,
+                    notes TEXT,
+                    FOREIGN KEY (property_id) REFERENCES properties (id)
+                )
+            ''')
+        
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS financial_data (
+                    id INTEGER PRIMARY KEY,
+                    property_id INTEGER,
+                    electricity_rate FLOAT,
+                    installation_cost_per_watt FLOAT,
+                    incentives FLOAT,
+                    financing_rate FLOAT,
+                    financing_term INTEGER,
+                    maintenance_cost_annual FLOAT,
+                    electricity_price_increase FLOAT,
+                    timestamp TIMESTAMP,
+                    FOREIGN KEY (property_id) REFERENCES properties (id)
+                )
+            ''')
+        
+            # Photo bytes now live on disk; add the reference columns to
+            # databases created before the move
+            photo_columns = {column[1] for column in
+                             cursor.execute("PRAGMA table_info(photos)")}
+            for column in ("photo_sha256", "photo_path"):
+                if column not in photo_columns:
+                    cursor.execute(f"ALTER TABLE photos ADD COLUMN {column} TEXT")
+        
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_photos_sha256 ON photos (photo_sha256)
+            ''')
+        
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_measurements_prop
+                ON measurements (property_id)
+            ''')
+        
+            # Covers the id tiebreak used when picking the latest row; replaces
+            # the earlier (property_id, timestamp) index
+            cursor.execute("DROP INDEX IF EXISTS idx_fin_prop_ts")
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_fin_prop_ts_id
+                ON financial_data (property_id, timestamp DESC, id DESC)
+            ''')
 
     def get_location_data(self, address: str) -> Dict:
         """Get GPS coordinates and timezone for an address"""
-        geolocator = Nominatim(user_agent="solar_audit_app")
-        location = geolocator.geocode(address)
+        return dict(self._lookup_location(address.strip().lower()))
+
+    def _geocode_address(self, address: str) -> Dict:
+        """Uncached geocoding and timezone lookup for a normalized address"""
+        location = self._geocode(address)
         
         if location:
-            tf = TimezoneFinder()
-            timezone = tf.timezone_at(lat=location.latitude, lng=location.longitude)
+            timezone = self._tf.timezone_at(lat=location.latitude, lng=location.longitude)
             
             return {
                 "latitude": location.latitude,
@@ -98,68 +307,213 @@ class SolarAudit:
     def add_property(self, address: str, roof_area: float, roof_angle: float, 
                     orientation: str, shading_factor: float) -> int:
         """Add a new property with location data"""
+        _orientation_azimuth(orientation)  # reject orientations reports can't use
         location_data = self.get_location_data(address)
         
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO properties 
-            (address, latitude, longitude, timezone, roof_area, roof_angle, 
-             orientation, shading_factor, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (address, location_data["latitude"], location_data["longitude"],
-              location_data["timezone"], roof_area, roof_angle, orientation,
-              shading_factor, datetime.now()))
-        
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.execute(self._INSERT_PROPERTY_SQL, (
+                address, location_data["latitude"], location_data["longitude"],
+                location_data["timezone"], roof_area, roof_angle, orientation,
+                shading_factor, datetime.now()))
+        
         return cursor.lastrowid
 
     def add_photo(self, property_id: int, photo_path: str, photo_type: str,
                  gps_latitude: float, gps_longitude: float, notes: str = None):
         """Add a photo with GPS data to the database"""
+        row, created = self._photo_row(property_id, photo_path, photo_type,
+                                       gps_latitude, gps_longitude, notes)
+        try:
+            with self.conn:
+                self.conn.execute(self._INSERT_PHOTO_SQL, row)
+        except BaseException:
+            if created:
+                self._discard_photo_files([row])
+            raise
+
+    def add_photos(self, photos: Iterable[Dict]):
+        """Add several photos in a single transaction
+        
+        Each entry takes the same keyword arguments as add_photo. Images are
+        resized on a thread pool (Pillow releases the GIL while decoding),
+        _PHOTO_BATCH_SIZE at a time, and every chunk is inserted with
+        executemany inside one transaction. If any photo fails, the
+        transaction rolls back and files written by this call are removed
+        unless another row already refers to them.
+        """
+        photos = iter(photos)
+        created_rows = []
+        try:
+            with ThreadPoolExecutor() as executor, self.conn:
+                while True:
+                    chunk = list(itertools.islice(photos, self._PHOTO_BATCH_SIZE))
+                    if not chunk:
+                        break
+                    futures = [executor.submit(self._photo_row, **photo) for photo in chunk]
+                    # Let the whole chunk finish so every file it wrote is known
+                    wait(futures)
+                    
+                    rows = []
+                    for future in futures:
+                        if future.exception() is None:
+                            row, created = future.result()
+                            rows.append(row)
+                            if created:
+                                created_rows.append(row)
+                    for future in futures:
+                        future.result()  # re-raise the first failure
+                    
+                    self.conn.executemany(self._INSERT_PHOTO_SQL, rows)
+        except BaseException:
+            self._discard_photo_files(created_rows)
+            raise
+
+    def _discard_photo_files(self, rows: List[tuple]):
+        """Remove stored files for rows that were not committed
+        
+        A file is kept if any committed row still refers to its hash.
+        """
+        for row in rows:
+            sha256, stored_path = row[2], row[3]
+            cursor = self.conn.execute(
+                'SELECT 1 FROM photos WHERE photo_sha256 = ? LIMIT 1', (sha256,))
+            if cursor.fetchone() is None:
+                try:
+                    os.remove(stored_path)
+                except FileNotFoundError:
+                    pass
+
+    def _photo_row(self, property_id: int, photo_path: str, photo_type: str,
+                   gps_latitude: float, gps_longitude: float, notes: str = None) -> tuple:
+        """Resize a photo, store it on disk and build its photos table row
+        
+        Returns the row and whether this call created the stored file.
+        
+        Files are content-addressed by SHA-256, so identical photos share a
+        single file under photo_dir. Each file is written to a temporary name
+        and renamed into place, so a stored path never holds a partial image.
+        """
         with Image.open(photo_path) as img:
-            # Resize image to reasonable size for storage
+            # Resize image to reasonable size for storage; draft lets the JPEG
+            # decoder downscale during decode instead of at full resolution
             max_size = (1024, 1024)
-            img.thumbnail(max_size, Image.LANCZOS)
+            img.draft("RGB", max_size)
+            img.thumbnail(max_size, Image.BILINEAR)
             
             # Convert to bytes
+            image_format = img.format or "JPEG"
             buffer = io.BytesIO()
-            img.save(buffer, format=img.format)
-            photo_data = buffer.getvalue()
+            img.save(buffer, format=image_format, quality=85, optimize=False)
         
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO photos 
-            (property_id, photo_type, photo_data, gps_latitude, gps_longitude, 
-             timestamp, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (property_id, photo_type, photo_data, gps_latitude, gps_longitude,
-              datetime.now(), notes))
+        # Hash and write straight from the BytesIO buffer without copying it
+        with buffer.getbuffer() as photo_data:
+            sha256 = hashlib.sha256(photo_data).hexdigest()
+            stored_path = os.path.join(self.photo_dir, sha256[:2],
+                                       f"{sha256}.{image_format.lower()}")
+            created = not os.path.exists(stored_path)
+            if created:
+                stored_dir = os.path.dirname(stored_path)
+                os.makedirs(stored_dir, exist_ok=True)
+                # Unique temp name; mode 0o666 lets the umask apply as it
+                # would for a plain open()
+                temp_path = f"{stored_path}.{uuid.uuid4().hex}.tmp"
+                fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(photo_data)
+                    os.replace(temp_path, stored_path)
+                except BaseException:
+                    os.unlink(temp_path)
+                    raise
         
-        self.conn.commit()
+        row = (property_id, photo_type, sha256, stored_path, gps_latitude,
+               gps_longitude, datetime.now(), notes)
+        return row, created
 
     def get_weather_data(self, latitude: float, longitude: float) -> Dict:
         """Fetch current weather data from OpenWeatherMap API"""
         if not self.weather_api_key:
             raise ValueError("Weather API key not provided")
+        
+        key = (round(latitude, 3), round(longitude, 3))
+        with self._weather_lock:
+            cached = self._weather_cache.get(key)
+        if cached is not None:
+            return dict(cached)
             
         url = f"http://api.openweathermap.org/data/2.5/weather?lat={latitude}&lon={longitude}&appid={self.weather_api_key}"
-        response = requests.get(url)
+        response = self._session.get(url, timeout=5)
         
         if response.status_code == 200:
             data = response.json()
-            return {
+            weather = {
                 "temperature": data["main"]["temp"] - 273.15,  # Convert K to C
                 "humidity": data["main"]["humidity"],
                 "cloud_cover": data["clouds"]["all"],
                 "solar_irradiance": self.estimate_solar_irradiance(data["clouds"]["all"])
             }
+            with self._weather_lock:
+                self._weather_cache[key] = weather
+            return dict(weather)
         raise Exception("Failed to fetch weather data")
 
     def estimate_solar_irradiance(self, cloud_cover: float) -> float:
         """Estimate solar irradiance based on cloud cover"""
         # Basic estimation - can be improved with more sophisticated models
-        max_irradiance = 1000  # W/m² on a clear day
-        return max_irradiance * (1 - (cloud_cover / 100) * 0.75)
+        return float(_irradiance_kernel(float(cloud_cover)))
+
+    def calculate_solar_potential(self, property_id: int) -> Dict:
+        """Estimate annual energy production for a property's roof"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT latitude, roof_area, roof_angle, orientation, shading_factor
+            FROM properties WHERE id = ?
+        ''', (property_id,))
+        property_data = cursor.fetchone()
+        
+        if not property_data:
+            raise ValueError("Property not found")
+        
+        cloud_cover = self._average_cloud_cover([property_id]).get(property_id)
+        return self._solar_potential(property_data, cloud_cover)
+
+    def _solar_potential(self, property_data, cloud_cover: Optional[float]) -> Dict:
+        """Annual production for an already-loaded property row
+        
+        cloud_cover is the property's average observed cloud cover, or None
+        to fall back to DEFAULT_CLOUD_COVER.
+        """
+        latitude = property_data["latitude"]
+        roof_area = property_data["roof_area"]
+        roof_angle = property_data["roof_angle"]
+        shading_factor = property_data["shading_factor"]
+        azimuth = _orientation_azimuth(property_data["orientation"])
+        
+        if cloud_cover is None:
+            cloud_cover = DEFAULT_CLOUD_COVER
+        
+        # Hourly plane-of-array irradiance (W/m²) over a year, summed to Wh/m²
+        incidence = _incidence_cosines(round(latitude, 1), roof_angle, azimuth)
+        annual_insolation = self.estimate_solar_irradiance(cloud_cover) * float(incidence.sum())
+        
+        annual_kwh = (annual_insolation / 1000 * roof_area * PANEL_EFFICIENCY
+                      * (1 - shading_factor))
+        
+        return {
+            "annual_insolation_kwh_m2": round(annual_insolation / 1000, 2),
+            "annual_potential_kwh": round(annual_kwh, 2),
+            "daily_average_kwh": round(annual_kwh / 365, 2),
+            "cloud_cover_assumed": round(cloud_cover, 1)
+        }
+
+    def _average_cloud_cover(self, property_ids: List[int]) -> Dict[int, float]:
+        """Average observed cloud cover for each property with measurements"""
+        placeholders = ",".join("?" * len(property_ids))
+        cursor = self.conn.execute(f'''
+            SELECT property_id, AVG(cloud_cover) AS cloud_cover FROM measurements
+            WHERE property_id IN ({placeholders}) GROUP BY property_id
+        ''', property_ids)
+        return {row["property_id"]: row["cloud_cover"] for row in cursor}
 
     def add_financial_data(self, property_id: int, electricity_rate: float,
                           installation_cost_per_watt: float, incentives: float = 0,
@@ -167,82 +521,128 @@ class SolarAudit:
                           maintenance_cost_annual: float = 0,
                           electricity_price_increase: float = 0.03):
         """Add financial parameters for analysis"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO financial_data 
-            (property_id, electricity_rate, installation_cost_per_watt, incentives,
-             financing_rate, financing_term, maintenance_cost_annual,
-             electricity_price_increase, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (property_id, electricity_rate, installation_cost_per_watt, incentives,
-              financing_rate, financing_term, maintenance_cost_annual,
-              electricity_price_increase, datetime.now()))
-        
-        self.conn.commit()
-
-    def calculate_detailed_financials(self, property_id: int, years: int = 25) -> Dict:
-        """Calculate detailed financial projections"""
-        cursor = self.conn.cursor()
-        
-        # Get financial data
-        cursor.execute('''
-            SELECT * FROM financial_data 
-            WHERE property_id = ? 
-            ORDER BY timestamp DESC LIMIT 1
-        ''', (property_id,))
-        financial_data = cursor.fetchone()
+        with self.conn:
+            self.conn.execute(self._INSERT_FINANCIAL_SQL, (
+                property_id, electricity_rate, installation_cost_per_watt, incentives,
+                financing_rate, financing_term, maintenance_cost_annual,
+                electricity_price_increase, datetime.now()))
+
+    def calculate_detailed_financials(self, property_id: int, years: int = 25,
+                                      as_records: bool = False) -> Dict:
+        """Calculate detailed financial projections
         
-        if not financial_data:
+        yearly_analysis is returned column-wise (one list per field) unless
+        as_records is set, in which case it is a list of per-year dicts.
+        """
+        financial_data = self._latest_financial_data([property_id]).get(property_id)
+        if financial_data is None:
             raise ValueError("Financial data not found for property")
-            
+        
         # Get solar potential
         solar_potential = self.calculate_solar_potential(property_id)
-        annual_production = solar_potential["annual_potential_kwh"]
-        
+        return self._financial_projection(financial_data,
+                                          solar_potential["annual_potential_kwh"],
+                                          years, as_records)
+
+    def _latest_financial_data(self, property_ids: List[int]) -> Dict[int, FinancialData]:
+        """Most recent financial parameters for each property that has any"""
+        columns = '''
+            property_id, electricity_rate, installation_cost_per_watt,
+            incentives, financing_rate, financing_term,
+            maintenance_cost_annual, electricity_price_increase
+        '''
+        if len(property_ids) == 1:
+            # A single property only needs one index seek, not its whole
+            # partition through the window function
+            cursor = self.conn.execute(f'''
+                SELECT {columns} FROM financial_data
+                WHERE property_id = ?
+                ORDER BY timestamp DESC, id DESC LIMIT 1
+            ''', property_ids)
+        else:
+            placeholders = ",".join("?" * len(property_ids))
+            cursor = self.conn.execute(f'''
+                SELECT {columns} FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY property_id ORDER BY timestamp DESC, id DESC
+                    ) AS recency
+                    FROM financial_data
+                    WHERE property_id IN ({placeholders})
+                )
+                WHERE recency = 1
+            ''', property_ids)
+        return {row["property_id"]: FinancialData(
+                    **{key: row[key] for key in row.keys() if key != "property_id"})
+                for row in cursor}
+
+    def _financial_projection(self, financial_data: FinancialData,
+                              annual_production: float, years: int = 25,
+                              as_records: bool = False) -> Dict:
+        """Financial projection from loaded parameters and annual production"""
         # System size and costs
         system_size_kw = annual_production / (365 * 4)  # Rough estimate
-        base_cost = system_size_kw * 1000 * financial_data[2]  # installation_cost_per_watt
-        net_cost = base_cost - financial_data[3]  # subtract incentives
+        base_cost = system_size_kw * 1000 * financial_data.installation_cost_per_watt
+        net_cost = base_cost - financial_data.incentives
         
-        # Initialize arrays for year-by-year analysis
-        yearly_analysis = []
-        cumulative_savings = 0
-        electricity_rate = financial_data[1]  # Starting electricity rate
+        elec_rate = financial_data.electricity_rate
+        maint = financial_data.maintenance_cost_annual
+        inc_rate = financial_data.electricity_price_increase
         
-        for year in range(1, years + 1):
-            # Calculate degradation (0.5% per year)
-            production = annual_production * (1 - 0.005 * year)
-            
-            # Calculate electricity savings
-            savings = production * electricity_rate
-            
-            # Add maintenance cost
-            net_savings = savings - financial_data[6]  # maintenance_cost_annual
-            
-            # Update cumulative savings
-            cumulative_savings += net_savings
-            
-            # Calculate ROI
-            roi = (cumulative_savings / net_cost) * 100 if net_cost > 0 else 0
-            
-            # Update electricity rate for next year
-            electricity_rate *= (1 + financial_data[7])  # electricity_price_increase
-            
-            yearly_analysis.append({
-                "year": year,
-                "production_kwh": round(production, 2),
-                "electricity_rate": round(electricity_rate, 3),
-                "yearly_savings": round(net_savings, 2),
-                "cumulative_savings": round(cumulative_savings, 2),
-                "roi_percentage": round(roi, 2)
-            })
+        # Year-by-year analysis, vectorized over the projection period
+        years_arr = np.arange(1, years + 1)
+        
+        # Calculate degradation (0.5% per year)
+        production = annual_production * _degradation_factors(years)
+        
+        # Savings use the rate in effect during the year; the reported rate
+        # is the escalated rate carried into the next year
+        rate_powers = _rate_powers(inc_rate, years)
+        savings = production * (elec_rate * rate_powers[:-1])
+        electricity_rates = elec_rate * rate_powers[1:]
+        
+        # Add maintenance cost
+        net_savings = savings - maint
+        cumulative = np.cumsum(net_savings)
+        
+        # Calculate ROI
+        if net_cost > 0:
+            roi = cumulative / net_cost * 100
+        else:
+            roi = np.zeros_like(cumulative)
+        
+        yearly_analysis = {
+            "year": years_arr.tolist(),
+            "production_kwh": production.round(2).tolist(),
+            "electricity_rate": electricity_rates.round(3).tolist(),
+            "yearly_savings": net_savings.round(2).tolist(),
+            "cumulative_savings": cumulative.round(2).tolist(),
+            "roi_percentage": roi.round(2).tolist()
+        }
+        if as_records:
+            keys = list(yearly_analysis)
+            yearly_analysis = [dict(zip(keys, row))
+                               for row in zip(*yearly_analysis.values())]
+        
+        cumulative_savings = float(cumulative[-1])
+        if (net_savings >= 0).all():
+            # Cumulative savings are non-decreasing, so binary search applies
+            idx = int(np.searchsorted(cumulative, net_cost, side="left"))
+            break_even_year = idx + 1 if idx < len(cumulative) else None
+        else:
+            reached = cumulative >= net_cost
+            break_even_year = int(np.argmax(reached)) + 1 if reached.any() else None
         
         # Calculate financing if applicable
         financing_details = None
-        if financial_data[4] > 0 and financial_data[5] > 0:  # if financing_rate and term exist
-            monthly_rate = financial_data[4] / 12 / 100
-            num_payments = financial_data[5] * 12
-            monthly_payment = (net_cost * monthly_rate * (1 + monthly_rate)**num_payments) / ((1 + monthly_rate)**num_payments - 1)
+        if financial_data.financing_rate > 0 and financial_data.financing_term > 0:
+            monthly_rate = financial_data.financing_rate / 12 / 100
+            num_payments = financial_data.financing_term * 12
+            # growth = (1 + r)^n - 1, computed without cancellation at small rates
+            growth = math.expm1(num_payments * math.log1p(monthly_rate))
+            if growth > 1e-12:
+                monthly_payment = net_cost * monthly_rate * (growth + 1) / growth
+            else:
+                monthly_payment = net_cost / num_payments
             
             financing_details = {
                 "monthly_payment": round(monthly_payment, 2),
@@ -254,7 +654,7 @@ class SolarAudit:
             "system_details": {
                 "size_kw": round(system_size_kw, 2),
                 "base_cost": round(base_cost, 2),
-                "incentives": round(financial_data[3], 2),
+                "incentives": round(financial_data.incentives, 2),
                 "net_cost": round(net_cost, 2)
             },
             "financing": financing_details,
@@ -262,53 +662,93 @@ class SolarAudit:
             "summary": {
                 "total_25_year_savings": round(cumulative_savings, 2),
                 "average_annual_savings": round(cumulative_savings / years, 2),
-                "break_even_year": next((year["year"] for year in yearly_analysis 
-                                      if year["cumulative_savings"] >= net_cost), None)
+                "break_even_year": break_even_year
             }
         }
 
     def generate_comprehensive_report(self, property_id: int) -> Dict:
         """Generate a comprehensive audit report including all data"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM properties WHERE id = ?', (property_id,))
-        property_data = cursor.fetchone()
+        return self.generate_reports([property_id])[0]
+
+    def generate_reports(self, property_ids: List[int]) -> List[Dict]:
+        """Generate comprehensive reports for several properties at once
         
-        if not property_data:
-            raise ValueError("Property not found")
+        Properties, photos, cloud cover and financial data are each loaded
+        with a single query for all properties, and weather is fetched
+        concurrently while they run. Reports are returned in the order
+        requested.
+        """
+        unique_ids = list(dict.fromkeys(property_ids))
+        if not unique_ids:
+            return []
+        placeholders = ",".join("?" * len(unique_ids))
         
-        # Get weather data
-        weather = self.get_weather_data(property_data[2], property_data[3])
+        cursor = self.conn.cursor()
+        cursor.execute(f'''
+            SELECT {self._REPORT_PROPERTY_COLUMNS} FROM properties
+            WHERE id IN ({placeholders})
+        ''', unique_ids)
+        properties = {row["id"]: row for row in cursor.fetchall()}
         
-        # Get photos
-        cursor.execute('SELECT id, photo_type, timestamp, notes FROM photos WHERE property_id = ?', 
-                      (property_id,))
-        photos = cursor.fetchall()
+        missing = [pid for pid in unique_ids if pid not in properties]
+        if missing:
+            raise ValueError(f"Property not found: {missing[0]}")
         
-        # Get all calculations
-        solar_potential = self.calculate_solar_potential(property_id)
-        financial_analysis = self.calculate_detailed_financials(property_id)
+        # get_weather_data does not touch the database, so the fetches can
+        # run on worker threads while the queries below use the connection
+        with ThreadPoolExecutor(max_workers=min(8, len(unique_ids))) as executor:
+            weather_futures = {
+                pid: executor.submit(self.get_weather_data,
+                                     row["latitude"], row["longitude"])
+                for pid, row in properties.items()
+            }
+            
+            cursor.execute(f'''
+                SELECT id, property_id, photo_type, timestamp, notes FROM photos
+                WHERE property_id IN ({placeholders}) ORDER BY property_id, id
+            ''', unique_ids)
+            photos = {pid: list(rows) for pid, rows in
+                      itertools.groupby(cursor.fetchall(), key=lambda row: row["property_id"])}
+            cloud_cover = self._average_cloud_cover(unique_ids)
+            financial_data = self._latest_financial_data(unique_ids)
+            
+            reports = {}
+            for pid, row in properties.items():
+                if pid not in financial_data:
+                    raise ValueError("Financial data not found for property")
+                solar_potential = self._solar_potential(row, cloud_cover.get(pid))
+                financial_analysis = self._financial_projection(
+                    financial_data[pid], solar_potential["annual_potential_kwh"])
+                reports[pid] = self._build_report(
+                    row, photos.get(pid, []), weather_futures[pid].result(),
+                    solar_potential, financial_analysis)
         
+        return [reports[pid] for pid in property_ids]
+
+    def _build_report(self, property_data, photos, weather: Dict,
+                      solar_potential: Dict, financial_analysis: Dict) -> Dict:
+        """Assemble a report from already-loaded rows and calculations"""
         return {
             "property_details": {
-                "address": property_data[1],
+                "address": property_data["address"],
                 "coordinates": {
-                    "latitude": property_data[2],
-                    "longitude": property_data[3]
+                    "latitude": property_data["latitude"],
+                    "longitude": property_data["longitude"]
                 },
-                "timezone": property_data[4],
+                "timezone": property_data["timezone"],
                 "roof_specifications": {
-                    "area": property_data[5],
-                    "angle": property_data[6],
-                    "orientation": property_data[7],
-                    "shading_factor": property_data[8]
+                    "area": property_data["roof_area"],
+                    "angle": property_data["roof_angle"],
+                    "orientation": property_data["orientation"],
+                    "shading_factor": property_data["shading_factor"]
                 }
             },
             "current_conditions": weather,
             "documentation": [{
-                "photo_id": photo[0],
-                "type": photo[1],
-                "timestamp": photo[2],
-                "notes": photo[3]
+                "photo_id": photo["id"],
+                "type": photo["photo_type"],
+                "timestamp": photo["timestamp"],
+                "notes": photo["notes"]
             } for photo in photos],
             "solar_potential": solar_potential,
             "financial_analysis": financial_analysis